@@ -0,0 +1,102 @@
+"""Benchmark cold start pdpb.py: waktu import dan time-to-first-paint.
+
+Setiap pengukuran dijalankan di proses Python baru, seperti worker
+``streamlit run`` yang baru dinyalakan:
+
+* import: biaya tambahan tiap modul berat setelah ``streamlit`` ter-import.
+* first paint: waktu dari awal script sampai file uploader di sidebar
+  (elemen terakhir kerangka halaman) dikirim ke browser.
+* render penuh: waktu sampai script selesai, tanpa memilih Triwulan.
+
+Contoh:
+    python bench_startup.py
+    python bench_startup.py --repeat 10
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from loadtest_pdpb import APP_PATH, siapkan_database
+
+MODUL_BERAT = ["pandas", "sqlalchemy", "plotly.express", "openpyxl"]
+
+IMPORT_CHILD = """
+import sys, time
+import streamlit
+start = time.perf_counter()
+import {modul}
+print((time.perf_counter() - start) * 1000)
+"""
+
+PAINT_CHILD = """
+import json, sys, time
+from streamlit.runtime.scriptrunner_utils.script_run_context import ScriptRunContext
+from streamlit.testing.v1 import AppTest
+
+hasil = {{"first_paint_ms": None}}
+enqueue_asli = ScriptRunContext.enqueue
+
+
+def enqueue(self, msg):
+    if (hasil["first_paint_ms"] is None and msg.WhichOneof("type") == "delta"
+            and msg.delta.new_element.WhichOneof("type") == "file_uploader"):
+        hasil["first_paint_ms"] = (time.perf_counter() - start) * 1000
+        hasil["modul_saat_paint"] = [m for m in {modul_berat!r} if m in sys.modules]
+    return enqueue_asli(self, msg)
+
+
+ScriptRunContext.enqueue = enqueue
+at = AppTest.from_file({app_path!r}, default_timeout=120)
+at.secrets["db_pdpb"] = {{"url": {db_url!r}}}
+start = time.perf_counter()
+at.run()
+hasil["render_ms"] = (time.perf_counter() - start) * 1000
+hasil["modul_setelah_render"] = [m for m in {modul_berat!r} if m in sys.modules]
+hasil["error"] = at.exception[0].message if at.exception else None
+print(json.dumps(hasil))
+"""
+
+
+def jalankan_child(code):
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return out.stdout.strip().splitlines()[-1]
+
+
+def ringkas(nilai):
+    return f"median {statistics.median(nilai):7.0f} ms   min {min(nilai):7.0f} ms"
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark cold start pdpb.py")
+    parser.add_argument("--repeat", type=int, default=5, help="Jumlah proses baru per pengukuran (default: 5)")
+    args = parser.parse_args(argv)
+
+    print("Import (setelah streamlit):")
+    for modul in MODUL_BERAT:
+        nilai = [float(jalankan_child(IMPORT_CHILD.format(modul=modul))) for _ in range(args.repeat)]
+        print(f"  {modul:<16} {ringkas(nilai)}")
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_url = f"sqlite:///{os.path.join(tmpdir, 'db_pdpb.sqlite')}"
+        siapkan_database(db_url)
+        code = PAINT_CHILD.format(modul_berat=MODUL_BERAT, app_path=APP_PATH, db_url=db_url)
+        runs = [json.loads(jalankan_child(code)) for _ in range(args.repeat)]
+
+    errors = {run["error"] for run in runs if run["error"]}
+    if errors or any(run["first_paint_ms"] is None for run in runs):
+        print(f"Render gagal: {', '.join(errors) or 'file uploader tidak tampil'}")
+        return 1
+    print("pdpb.py (proses baru):")
+    print(f"  {'first paint':<16} {ringkas([run['first_paint_ms'] for run in runs])}")
+    print(f"  {'render penuh':<16} {ringkas([run['render_ms'] for run in runs])}")
+    print(f"  modul ter-import saat first paint : {', '.join(runs[-1]['modul_saat_paint']) or '-'}")
+    print(f"  modul ter-import setelah render   : {', '.join(runs[-1]['modul_setelah_render']) or '-'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,12 +1,14 @@
 import streamlit as st
-import pandas as pd
 import re
-from sqlalchemy import create_engine, text
-from sqlalchemy.exc import SQLAlchemyError
-import plotly.express as px
 
-db_url = st.secrets["db_pdpb"]["url"]
-engine = create_engine(db_url)
+# pandas & SQLAlchemy di-import setelah kerangka halaman tampil (lihat bagian Sidebar),
+# plotly.express saat data ditampilkan, openpyxl oleh pandas saat file Excel dibaca.
+
+@st.cache_resource(show_spinner=False)
+def get_engine():
+    # Dibuat sekali per proses dan dipakai bersama semua sesi; koneksi baru dibuka saat query pertama
+    from sqlalchemy import create_engine
+    return create_engine(st.secrets["db_pdpb"]["url"])
 
 # host = "localhost"
 # user = "postgres"
@@ -243,6 +245,18 @@ st.markdown("---")
 st.sidebar.write(f"<span style='font-weight:bold;'>Pilih data triwulan atau upload file MODEL-A REKAP PDPB Kabupaten Malang.</span>", unsafe_allow_html=True)
 # engine = create_engine(f'postgresql+psycopg2://{user}:{password}@{host}:{port}/{database}')
 st.sidebar.markdown("### 📅 Pilih Triwulan yang Sudah Terupload")
+pilih_triwulan = st.sidebar.container()
+
+st.sidebar.markdown("---")
+st.sidebar.markdown("### 📂 Upload data Triwulan ")
+uploaded_file = st.sidebar.file_uploader("Upload file Excel", type=["xlsx"])
+
+# Kerangka halaman sudah terkirim ke browser; baru import modul berat & akses database
+import pandas as pd
+from sqlalchemy import text
+from sqlalchemy.exc import SQLAlchemyError
+
+engine = get_engine()
 
 try:
     with engine.connect() as conn:
@@ -258,11 +272,13 @@ try:
             for row in triwulan_list
         }
 
-        selected_label = st.sidebar.selectbox("Pilih data Triwulan:", list(triwulan_options.keys()))
+        selected_label = pilih_triwulan.selectbox("Pilih data Triwulan:", list(triwulan_options.keys()))
         selected_id = triwulan_options[selected_label]
         
         info_box = st.empty()
-        if st.sidebar.button("📊 Tampilkan Data"):
+        if pilih_triwulan.button("📊 Tampilkan Data"):
+            import plotly.express as px
+
             with engine.connect() as conn:
                 df_pdpb_before = pd.read_sql(
                     text("SELECT nama_kecamatan,jumlah_tps,laki,perempuan,total FROM triwulan_sebelumnya WHERE id_triwulan = :id"),
@@ -546,13 +562,9 @@ try:
         else:
             info_box.info("Silakan **pilih data Triwulan** terlebih dahulu pada panel sebelah kiri & **Upload** jika diperlukan.")
     else:
-        st.sidebar.info("Belum ada data Triwulan yang tersimpan di database.")
+        pilih_triwulan.info("Belum ada data Triwulan yang tersimpan di database.")
 except Exception as e:
-    st.sidebar.error(f"Gagal mengambil daftar Triwulan: {e}")
-
-st.sidebar.markdown("---")
-st.sidebar.markdown("### 📂 Upload data Triwulan ")
-uploaded_file = st.sidebar.file_uploader("Upload file Excel", type=["xlsx"])
+    pilih_triwulan.error(f"Gagal mengambil daftar Triwulan: {e}")
 
 # --- Proses Utama ---
 if uploaded_file:
@@ -589,6 +601,16 @@ if uploaded_file:
                     st.error("Gagal mendapatkan ID Triwulan dari database.")
                     st.stop()
 
+                # --- CEK DUPLIKAT (sebelum menyimpan apa pun) ---
+                with engine.connect() as conn:
+                    existing = pd.read_sql(
+                        text("SELECT id_triwulan FROM rekapitulasi_pdpb WHERE id_triwulan = :id"),
+                        conn, params={"id": id_triwulan}
+                    )
+                if not existing.empty:
+                    st.warning("Data untuk triwulan ini sudah ada di tabel rekapitulasi_pdpb — tidak disimpan ulang.")
+                    st.stop()
+
                 # --- PDPB (TRIWULAN SEBELUMNYA) ---
                 st.toast("Mencari sheet `PDPB sebelumnya`...")
                 xls = pd.ExcelFile(uploaded_file, engine="openpyxl")
@@ -660,16 +682,6 @@ if uploaded_file:
 
             st.success("🎉 Semua data berhasil disimpan dan terhubung dengan Triwulan.")
             st.balloons()
-
-            # --- SIMPAN KE REKAPITULASI PDPB (CEK DUPLIKAT) ---
-            existing = pd.read_sql(
-            text("SELECT id_triwulan FROM rekapitulasi_pdpb WHERE id_triwulan = :id"),
-            conn, params={"id": id_triwulan}
-            )
-            if existing.empty:
-                df_pdpb_clean.to_sql('rekapitulasi_pdpb', conn, if_exists='append', index=False)
-            else:
-                st.warning("Data untuk triwulan ini sudah ada di tabel rekapitulasi_pdpb.")
                 
         except Exception as e:
             st.error(f"Terjadi kesalahan: {e}")